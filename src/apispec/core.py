@@ -32,6 +32,27 @@ MIN_INCLUSIVE_OPENAPI_VERSION = Version("2.0")
 MAX_EXCLUSIVE_OPENAPI_VERSION = Version("4.0")
 
 
+def _plugins_implementing(
+    plugins: Sequence[BasePlugin], helper: str
+) -> list[BasePlugin]:
+    """Return the plugins overriding the given `BasePlugin` helper
+
+    :param list plugins: plugins registered in the spec
+    :param str helper: name of the helper method (e.g. "schema_helper")
+    """
+    # Imported here as the plugin module imports this one
+    from .plugin import BasePlugin
+
+    default = getattr(BasePlugin, helper)
+    implementing: list[BasePlugin] = []
+    for plugin in plugins:
+        # Plugins not deriving from BasePlugin may lack some helpers
+        method = getattr(plugin, helper, None)
+        if method is not None and getattr(method, "__func__", None) is not default:
+            implementing.append(plugin)
+    return implementing
+
+
 class Components:
     """Stores OpenAPI components
 
@@ -45,6 +66,7 @@ class Components:
         openapi_version: Version,
     ) -> None:
         self._plugins = plugins
+        self._find_plugin_helpers()
         self.openapi_version = openapi_version
         self.schemas: dict[str, dict] = {}
         self.responses: dict[str, dict] = {}
@@ -74,12 +96,18 @@ class Components:
             "example": self.examples_lazy,
         }
 
+    def _find_plugin_helpers(self) -> None:
+        """Find the plugins overriding each component helper"""
+        self._schema_helpers = _plugins_implementing(self._plugins, "schema_helper")
+        self._response_helpers = _plugins_implementing(self._plugins, "response_helper")
+        self._parameter_helpers = _plugins_implementing(
+            self._plugins, "parameter_helper"
+        )
+        self._header_helpers = _plugins_implementing(self._plugins, "header_helper")
+
     def to_dict(self) -> dict[str, dict]:
-        return {
-            COMPONENT_SUBSECTIONS[self.openapi_version.major][k]: v
-            for k, v in self._subsections.items()
-            if v != {}
-        }
+        subsection_names = COMPONENT_SUBSECTIONS[self.openapi_version.major]
+        return {subsection_names[k]: v for k, v in self._subsections.items() if v}
 
     def _register_component(
         self,
@@ -99,12 +127,10 @@ class Components:
         obj_type: str,
         component_id: str,
     ) -> None:
-        component_buffer = self._subsections_lazy[obj_type]
         # If component was lazy registered, register it for real
-        if component_id in component_buffer:
-            self._subsections[obj_type][component_id] = component_buffer.pop(
-                component_id
-            )
+        component = self._subsections_lazy[obj_type].pop(component_id, None)
+        if component is not None:
+            self._subsections[obj_type][component_id] = component
 
     def get_ref(
         self,
@@ -166,7 +192,7 @@ class Components:
             )
         ret = deepcopy(component) or {}
         # Execute all helpers from plugins
-        for plugin in self._plugins:
+        for plugin in self._schema_helpers:
             try:
                 ret.update(plugin.schema_helper(component_id, ret, **kwargs) or {})
             except PluginMethodNotImplementedError:
@@ -196,7 +222,7 @@ class Components:
             )
         ret = deepcopy(component) or {}
         # Execute all helpers from plugins
-        for plugin in self._plugins:
+        for plugin in self._response_helpers:
             try:
                 ret.update(plugin.response_helper(ret, **kwargs) or {})
             except PluginMethodNotImplementedError:
@@ -235,7 +261,7 @@ class Components:
             ret["required"] = True
 
         # Execute all helpers from plugins
-        for plugin in self._plugins:
+        for plugin in self._parameter_helpers:
             try:
                 ret.update(plugin.parameter_helper(ret, **kwargs) or {})
             except PluginMethodNotImplementedError:
@@ -267,7 +293,7 @@ class Components:
                 f'Another header with name "{component_id}" is already registered.'
             )
         # Execute all helpers from plugins
-        for plugin in self._plugins:
+        for plugin in self._header_helpers:
             try:
                 ret.update(plugin.header_helper(ret, **kwargs) or {})
             except PluginMethodNotImplementedError:
@@ -318,16 +344,16 @@ class Components:
 
     def _resolve_examples(self, obj) -> None:
         """Replace example reference as string with a $ref"""
-        for name, example in obj.get("examples", {}).items():
-            obj["examples"][name] = self.get_ref("example", example)
+        examples = obj.get("examples", {})
+        for name, example in examples.items():
+            examples[name] = self.get_ref("example", example)
 
     def _resolve_refs_in_schema(self, schema: dict) -> None:
         if "properties" in schema:
-            for key in schema["properties"]:
-                schema["properties"][key] = self.get_ref(
-                    "schema", schema["properties"][key]
-                )
-                self._resolve_refs_in_schema(schema["properties"][key])
+            properties = schema["properties"]
+            for key, prop in properties.items():
+                properties[key] = self.get_ref("schema", prop)
+                self._resolve_refs_in_schema(properties[key])
         if "items" in schema:
             schema["items"] = self.get_ref("schema", schema["items"])
             self._resolve_refs_in_schema(schema["items"])
@@ -360,9 +386,10 @@ class Components:
             for media_type in response.get("content", {}).values():
                 self._resolve_schema(media_type)
                 self._resolve_examples(media_type)
-            for name, header in response.get("headers", {}).items():
-                response["headers"][name] = self.get_ref("header", header)
-                self._resolve_refs_in_parameter_or_header(response["headers"][name])
+            headers = response.get("headers", {})
+            for name, header in headers.items():
+                headers[name] = self.get_ref("header", header)
+                self._resolve_refs_in_parameter_or_header(headers[name])
             # TODO: Resolve link refs when Components supports links
 
     def _resolve_refs_in_operation(self, operation) -> None:
@@ -446,6 +473,7 @@ class APISpec:
         # Metadata
         self._tags: list[dict] = []
         self._paths: dict = {}
+        self._valid_methods = frozenset(VALID_METHODS[self.openapi_version.major])
 
         # Components
         self.components = Components(self.plugins, self.openapi_version)
@@ -454,6 +482,13 @@ class APISpec:
         for plugin in self.plugins:
             plugin.init_spec(self)
 
+        # Plugins may set their helpers in init_spec
+        self.components._find_plugin_helpers()
+        self._path_helpers = _plugins_implementing(self.plugins, "path_helper")
+        self._operation_helpers = _plugins_implementing(
+            self.plugins, "operation_helper"
+        )
+
     def to_dict(self) -> dict[str, typing.Any]:
         ret: dict[str, typing.Any] = {
             "paths": self._paths,
@@ -516,7 +551,7 @@ class APISpec:
         parameters = deepcopy(parameters) or []
 
         # Execute path helpers
-        for plugin in self.plugins:
+        for plugin in self._path_helpers:
             try:
                 ret = plugin.path_helper(
                     path=path, operations=operations, parameters=parameters, **kwargs
@@ -529,7 +564,7 @@ class APISpec:
             raise APISpecError("Path template is not specified.")
 
         # Execute operation helpers
-        for plugin in self.plugins:
+        for plugin in self._operation_helpers:
             try:
                 plugin.operation_helper(path=path, operations=operations, **kwargs)
             except PluginMethodNotImplementedError:
@@ -537,16 +572,18 @@ class APISpec:
 
         self._clean_operations(operations)
 
-        self._paths.setdefault(path, operations).update(operations)
         if summary is not None:
-            self._paths[path]["summary"] = summary
+            operations["summary"] = summary
         if description is not None:
-            self._paths[path]["description"] = description
+            operations["description"] = description
         if parameters:
-            parameters = self._clean_parameters(parameters)
-            self._paths[path]["parameters"] = parameters
+            operations["parameters"] = self._clean_parameters(parameters)
+
+        # Only resolve refs in what is being added: operations already
+        # registered for this path were resolved by previous calls
+        self.components.resolve_refs_in_path(operations)
 
-        self.components.resolve_refs_in_path(self._paths[path])
+        self._paths.setdefault(path, operations).update(operations)
 
         return self
 
@@ -563,10 +600,16 @@ class APISpec:
         :param list parameters: List of parameters mapping
         """
         seen = set()
-        for parameter in [p for p in parameters if isinstance(p, dict)]:
+        for parameter in parameters:
+            # References to parameter components are checked when registered
+            if not isinstance(parameter, dict):
+                continue
+
             # check missing name / location
-            missing_attrs = [attr for attr in ("name", "in") if attr not in parameter]
-            if missing_attrs:
+            if "name" not in parameter or "in" not in parameter:
+                missing_attrs = [
+                    attr for attr in ("name", "in") if attr not in parameter
+                ]
                 raise InvalidParameterError(
                     f"Missing keys {missing_attrs} for parameter"
                 )
@@ -600,32 +643,35 @@ class APISpec:
 
         :param dict operations: Dict mapping status codes to operations
         """
-        operation_names = set(operations)
-        valid_methods = set(VALID_METHODS[self.openapi_version.major])
-        invalid = {
-            key for key in operation_names - valid_methods if not key.startswith("x-")
-        }
+        invalid = [
+            key
+            for key in operations
+            if key not in self._valid_methods and not key.startswith("x-")
+        ]
         if invalid:
             raise APISpecError(
                 "One or more HTTP methods are invalid: {}".format(", ".join(invalid))
             )
 
-        for operation in (operations or {}).values():
+        for operation in operations.values():
             if "parameters" in operation:
                 operation["parameters"] = self._clean_parameters(
                     operation["parameters"]
                 )
             if "responses" in operation:
                 responses = {}
+                non_integer_code = False
                 for code, response in operation["responses"].items():
                     try:
                         code = int(code)  # handles IntEnums like http.HTTPStatus
                     except (TypeError, ValueError):
-                        if self.openapi_version.major < 3 and code != "default":
-                            warnings.warn(
-                                "Non-integer code not allowed in OpenAPI < 3",
-                                UserWarning,
-                                stacklevel=2,
-                            )
+                        if code != "default":
+                            non_integer_code = True
                     responses[str(code)] = response
+                if non_integer_code and self.openapi_version.major < 3:
+                    warnings.warn(
+                        "Non-integer code not allowed in OpenAPI < 3",
+                        UserWarning,
+                        stacklevel=2,
+                    )
                 operation["responses"] = responses
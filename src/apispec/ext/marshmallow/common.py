@@ -72,11 +72,13 @@ def warn_if_fields_defined_in_meta(fields: dict[str, fields.Field], Meta):
     :param dict fields: A dictionary of fields name field object pairs
     :param Meta: the schema's Meta class
     """
-    if getattr(Meta, "fields", None) or getattr(Meta, "additional", None):
+    meta_fields = getattr(Meta, "fields", None)
+    meta_additional = getattr(Meta, "additional", None)
+    if meta_fields or meta_additional:
         declared_fields = set(fields.keys())
         if (
-            set(getattr(Meta, "fields", set())) > declared_fields
-            or set(getattr(Meta, "additional", set())) > declared_fields
+            set(meta_fields or ()) > declared_fields
+            or set(meta_additional or ()) > declared_fields
         ):
             warnings.warn(
                 "Only explicitly-declared fields will be included in the Schema Object. "
@@ -95,9 +97,11 @@ def filter_excluded_fields(
     :param Meta: the schema's Meta class
     :param bool exclude_dump_only: whether to filter dump_only fields
     """
-    exclude = list(getattr(Meta, "exclude", []))
+    exclude = set(getattr(Meta, "exclude", ()))
     if exclude_dump_only:
-        exclude.extend(getattr(Meta, "dump_only", []))
+        exclude.update(getattr(Meta, "dump_only", ()))
+    elif not exclude:
+        return dict(fields)
 
     filtered_fields = {
         key: value
@@ -424,19 +424,16 @@ class FieldConverterMixin:
         :param Field field: A marshmallow field.
         :rtype: dict
         """
-        # Dasherize metadata that starts with x_
-        metadata = {
-            key.replace("_", "-") if key.startswith("x_") else key: value
-            for key, value in field.metadata.items()
-            if isinstance(key, str)
-        }
-
-        # Avoid validation error with "Additional properties not allowed"
-        ret = {
-            key: value
-            for key, value in metadata.items()
-            if key in _VALID_PROPERTIES or key.startswith(_VALID_PREFIX)
-        }
+        ret = {}
+        for key, value in field.metadata.items():
+            if not isinstance(key, str):
+                continue
+            # Dasherize metadata that starts with x_
+            if key.startswith("x_"):
+                key = key.replace("_", "-")
+            # Avoid validation error with "Additional properties not allowed"
+            if key in _VALID_PROPERTIES or key.startswith(_VALID_PREFIX):
+                ret[key] = value
         return ret
 
     def nested2properties(self, field: marshmallow.fields.Field, ret) -> dict:
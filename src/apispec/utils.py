@@ -23,6 +23,17 @@ COMPONENT_SUBSECTIONS = {
     },
 }
 
+# Reference paths up to the component name, by OpenAPI major version and component type
+_REFERENCE_PREFIXES = {
+    openapi_major_version: {
+        component_type: "#/{}{}/".format(
+            "components/" if openapi_major_version >= 3 else "", subsection
+        )
+        for component_type, subsection in subsections.items()
+    }
+    for openapi_major_version, subsections in COMPONENT_SUBSECTIONS.items()
+}
+
 
 def build_reference(
     component_type: str, openapi_major_version: int, component_name: str
@@ -33,13 +44,8 @@ def build_reference(
     :param int openapi_major_version: OpenAPI major version (2 or 3)
     :param str component_name: Name of component to reference
     """
-    return {
-        "$ref": "#/{}{}/{}".format(
-            "components/" if openapi_major_version >= 3 else "",
-            COMPONENT_SUBSECTIONS[openapi_major_version][component_type],
-            component_name,
-        )
-    }
+    prefix = _REFERENCE_PREFIXES[openapi_major_version][component_type]
+    return {"$ref": prefix + component_name}
 
 
 # from django.contrib.admindocs.utils
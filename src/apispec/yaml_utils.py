@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import typing
 
 import yaml
@@ -20,6 +22,12 @@ def dict_to_yaml(dic: dict, yaml_dump_kwargs: typing.Any | None = None) -> str:
 
 def load_yaml_from_docstring(docstring: str) -> dict:
     """Loads YAML from docstring."""
+    # Parsed YAML is cached, return a copy the caller can mutate
+    return copy.deepcopy(_load_yaml_from_docstring(docstring))
+
+
+@functools.lru_cache(maxsize=1024)
+def _load_yaml_from_docstring(docstring: str) -> dict:
     split_lines = trim_docstring(docstring).split("\n")
 
     # Cut YAML from rest of docstring
@@ -10,6 +10,7 @@ from apispec.exceptions import (
     DuplicateComponentNameError,
     DuplicateParameterError,
     InvalidParameterError,
+    PluginMethodNotImplementedError,
 )
 
 from .utils import (
@@ -699,6 +700,26 @@ class TestPath(RefsSchemaTestMixin):
         assert "get" in p
         assert "put" in p
 
+    def test_path_merge_resolves_refs_in_added_operations(self, spec):
+        spec.components.response("NotFound", {"description": "Not found"}, lazy=True)
+        spec.path(
+            path="/pet",
+            operations={"get": {"responses": {"200": {"description": "OK"}}}},
+            parameters=[{"name": "q", "in": "query"}],
+        )
+        spec.path(
+            path="/pet",
+            summary="Pets",
+            operations={"post": {"responses": {"404": "NotFound"}}},
+        )
+
+        p = get_paths(spec)["/pet"]
+        assert p["get"]["responses"]["200"] == {"description": "OK"}
+        assert p["post"]["responses"]["404"] == build_ref(spec, "response", "NotFound")
+        assert p["parameters"] == [{"name": "q", "in": "query"}]
+        assert p["summary"] == "Pets"
+        assert "NotFound" in get_responses(spec)
+
     @pytest.mark.parametrize("openapi_version", ("2.0", "3.0.0"))
     def test_path_called_twice_with_same_operations_parameters(self, openapi_version):
         """Test calling path twice with same operations or parameters
@@ -887,12 +908,46 @@ class TestPath(RefsSchemaTestMixin):
 
         assert status_code in get_paths(spec)["/pet/{petId}"]["get"]["responses"]
 
+    def test_path_response_with_status_code_ranges_warns_once(self, spec, recwarn):
+        spec.path(
+            path="/pet/{petId}",
+            operations={
+                "get": {
+                    "responses": {
+                        "2XX": "test_response",
+                        "4XX": "test_response",
+                        "default": "test_response",
+                    }
+                }
+            },
+        )
+
+        if spec.openapi_version.major < 3:
+            assert len(recwarn) == 1
+            assert recwarn.pop(UserWarning)
+        else:
+            assert len(recwarn) == 0
+
     def test_path_check_invalid_http_method(self, spec):
         spec.path("/pet/{petId}", operations={"get": {}})
         spec.path("/pet/{petId}", operations={"x-dummy": {}})
         message = "One or more HTTP methods are invalid"
         with pytest.raises(APISpecError, match=message):
             spec.path("/pet/{petId}", operations={"dummy": {}})
+        with pytest.raises(APISpecError, match=f"{message}: dummy, other"):
+            spec.path("/pet/{petId}", operations={"dummy": {}, "other": {}})
+
+    def test_path_check_invalid_http_method_before_parameters(self, spec):
+        parameter = {"name": "petId", "in": "path"}
+        message = "One or more HTTP methods are invalid: dummy"
+        with pytest.raises(APISpecError, match=message):
+            spec.path(
+                "/pet/{petId}",
+                operations={
+                    "get": {"parameters": [parameter, parameter]},
+                    "dummy": {},
+                },
+            )
 
     def test_path_resolve_response_schema(self, spec):
         schema = {"schema": "PetSchema"}
@@ -1233,6 +1288,97 @@ class TestPlugins:
         assert len(paths) == 1
         assert paths["/path_2"] == {"post": {"responses": {"201": {}}}}
 
+    def test_plugin_helper_may_raise_not_implemented(self):
+        class ConditionalPlugin(BasePlugin):
+            def schema_helper(self, name, definition, **kwargs):
+                if name != "Pet":
+                    raise PluginMethodNotImplementedError
+                return {"description": "A pet"}
+
+        spec = APISpec(
+            title="Swagger Petstore",
+            version="1.0.0",
+            openapi_version="3.0.0",
+            plugins=(BasePlugin(), ConditionalPlugin()),
+        )
+        spec.components.schema("Pet", {})
+        spec.components.schema("Owner", {})
+        spec.path("/pet", operations={"get": {"responses": {200: {}}}})
+        definitions = get_schemas(spec)
+        assert definitions["Pet"] == {"description": "A pet"}
+        assert definitions["Owner"] == {}
+
+    def test_plugin_helper_not_overridden_is_not_called(self, monkeypatch):
+        calls = []
+
+        def not_implemented(self, *args, **kwargs):
+            calls.append(args)
+            raise PluginMethodNotImplementedError
+
+        for helper in (
+            "schema_helper",
+            "response_helper",
+            "parameter_helper",
+            "header_helper",
+            "path_helper",
+            "operation_helper",
+        ):
+            monkeypatch.setattr(BasePlugin, helper, not_implemented)
+
+        spec = APISpec(
+            title="Swagger Petstore",
+            version="1.0.0",
+            openapi_version="3.0.0",
+            plugins=(BasePlugin(),),
+        )
+        spec.components.schema("Pet", {})
+        spec.components.response("NotFound", {"description": "Not found"})
+        spec.components.parameter("PetId", "path")
+        spec.components.header("Rate-Limit", {"schema": {"type": "integer"}})
+        spec.path("/pet", operations={"get": {"responses": {200: {}}}})
+        assert calls == []
+
+    def test_plugin_helper_set_in_init_spec_is_used(self):
+        class InitSpecPlugin(BasePlugin):
+            def init_spec(self, spec):
+                self.schema_helper = self._schema_helper
+                self.path_helper = self._path_helper
+
+            def _schema_helper(self, name, definition, **kwargs):
+                return {"description": "A pet"}
+
+            def _path_helper(self, path, operations, **kwargs):
+                return "/pet_modified"
+
+        spec = APISpec(
+            title="Swagger Petstore",
+            version="1.0.0",
+            openapi_version="3.0.0",
+            plugins=(InitSpecPlugin(),),
+        )
+        spec.components.schema("Pet", {})
+        spec.path("/pet", operations={"get": {"responses": {200: {}}}})
+        assert get_schemas(spec)["Pet"] == {"description": "A pet"}
+        assert "/pet_modified" in get_paths(spec)
+
+    def test_plugin_without_all_helpers(self):
+        class DuckTypedPlugin:
+            def init_spec(self, spec):
+                pass
+
+            def schema_helper(self, name, definition, **kwargs):
+                return {"description": "A pet"}
+
+        spec = APISpec(
+            title="Swagger Petstore",
+            version="1.0.0",
+            openapi_version="3.0.0",
+            plugins=(DuckTypedPlugin(),),
+        )
+        spec.components.schema("Pet", {})
+        spec.path("/pet", operations={"get": {"responses": {200: {}}}})
+        assert get_schemas(spec)["Pet"] == {"description": "A pet"}
+
 
 class TestPluginsOrder:
     class OrderedPlugin(BasePlugin):
@@ -196,6 +196,30 @@ class TestMarshmallowSchemaToModelDefinition:
         props = res["properties"]
         assert "_id" in props
 
+    def test_schema2jsonschema_uses_attribute_functions_added_later(self, openapi):
+        class UserSchema(Schema):
+            name = fields.Str()
+
+        def custom2properties(self, field, **kwargs):
+            return {"x-custom": True}
+
+        openapi.schema2jsonschema(UserSchema())
+        openapi.add_attribute_function(custom2properties)
+        res = openapi.schema2jsonschema(UserSchema())
+        assert res["properties"]["name"]["x-custom"] is True
+
+    def test_schema2jsonschema_uses_field_mapping_changed_later(self, openapi):
+        class CustomField(fields.Field):
+            pass
+
+        class UserSchema(Schema):
+            name = CustomField()
+
+        openapi.schema2jsonschema(UserSchema())
+        openapi.map_to_openapi_type(CustomField, "integer", None)
+        res = openapi.schema2jsonschema(UserSchema())
+        assert res["properties"]["name"]["type"] == "integer"
+
     def test_raises_error_if_no_declared_fields(self, openapi):
         class NotASchema:
             pass
@@ -404,6 +428,25 @@ class PetSchema(Schema):
 
 
 class TestNesting:
+    @pytest.mark.parametrize("openapi_version", ("2.0", "3.0.0"))
+    def test_schema2jsonschema_uses_refs_registered_after_inlining(
+        self, openapi_version
+    ):
+        spec = APISpec(
+            title="Pets",
+            version="0.1",
+            openapi_version=openapi_version,
+            plugins=(MarshmallowPlugin(schema_name_resolver=lambda schema: None),),
+        )
+        converter = spec.plugins[0].converter
+        inlined = converter.resolve_nested_schema(PetSchema)
+        assert "$ref" not in inlined["properties"]["category"]["items"]
+
+        spec.components.schema("Category", schema=CategorySchema)
+        spec.components.schema("Pet", schema=PetSchema)
+        props = get_schemas(spec)["Pet"]["properties"]
+        assert props["category"]["items"] == build_ref(spec, "schema", "Category")
+
     def test_schema2jsonschema_with_nested_fields(self, spec_fixture):
         res = spec_fixture.openapi.schema2jsonschema(PetSchema)
         props = res["properties"]
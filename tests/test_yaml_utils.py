@@ -45,3 +45,18 @@ def test_dict_to_yaml_keys_can_be_sorted_with_yaml_dump_kwargs():
         )
         == "derp: 2\nherp: 1\n"
     )
+
+
+def test_load_yaml_from_docstring_returns_a_new_dict_each_call():
+    docstring = """
+    ---
+    get:
+        responses:
+            200:
+                description: OK
+    """
+    result = yaml_utils.load_yaml_from_docstring(docstring)
+    result["get"]["responses"][200]["description"] = "Changed"
+    assert yaml_utils.load_yaml_from_docstring(docstring) == {
+        "get": {"responses": {200: {"description": "OK"}}}
+    }